@@ -16,6 +16,14 @@ from ..subroutineinfo import SubroutineInfo
 RiscvAsmEmitter: an AsmEmitter for RiscV
 """
 
+# Comparisons without a single RiscV instruction, lowered to a binary op followed by a unary op on its result.
+FUSED_BINARY_OPS = {
+    BinaryOp.EQU: (BinaryOp.SUB, UnaryOp.SEQZ),
+    BinaryOp.NEQ: (BinaryOp.SUB, UnaryOp.SNEZ),
+    BinaryOp.LEQ: (BinaryOp.SGT, UnaryOp.SEQZ),
+    BinaryOp.GEQ: (BinaryOp.SLT, UnaryOp.SEQZ),
+}
+
 
 class RiscvAsmEmitter(AsmEmitter):
     def __init__(
@@ -77,7 +85,12 @@ class RiscvAsmEmitter(AsmEmitter):
             self.seq.append(Riscv.Unary(instr.op, instr.dst, instr.operand))
  
         def visitBinary(self, instr: Binary) -> None:
-            self.seq.append(Riscv.Binary(instr.op, instr.dst, instr.lhs, instr.rhs))
+            if instr.op in FUSED_BINARY_OPS:
+                binaryOp, unaryOp = FUSED_BINARY_OPS[instr.op]
+                self.seq.append(Riscv.Binary(binaryOp, instr.dst, instr.lhs, instr.rhs))
+                self.seq.append(Riscv.Unary(unaryOp, instr.dst, instr.dst))
+            else:
+                self.seq.append(Riscv.Binary(instr.op, instr.dst, instr.lhs, instr.rhs))
 
         def visitCondBranch(self, instr: CondBranch) -> None:
             self.seq.append(Riscv.Branch(instr.op, instr.cond, instr.label))
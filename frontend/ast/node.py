@@ -23,6 +23,9 @@ class Operator(Enum):
     Base class of operators.
     """
 
+    # Hashed by identity, see `utils.tac.tacop.Operation`.
+    __hash__ = object.__hash__
+
     @classmethod
     def backward_search(cls: type[_T], s: str) -> _T:
         """
@@ -87,18 +90,29 @@ it's no need to make a enumeration for it.
 """
 
 
+_SLOT_ATTRS = frozenset(("val", "symbol"))
+
+
 class Node(ABC):
     """
     Base class of all AST nodes.
     """
 
+    # Every subclass declares `__slots__` too, so AST nodes carry no `__dict__`.
+    # `val` and `symbol` are read on every visit of the later phases,
+    # so they are kept as slots rather than entries of `_attrs`.
+    __slots__ = ("name", "_attrs", "val", "symbol")
+
     def __init__(self, name: str) -> None:
         """Constructor.
         `name`: name of this kind of node. Used when represents the node by a string.
-        `_attrs`: used to store additional information on AST nodes.
+        `_attrs`: used to store additional information on AST nodes (created on first use).
+        `val`: the temp variable holding the value of this node (set in TAC generation, left unset until then).
+        `symbol`: the symbol this node refers to (set in the namer phase).
         """
         self.name = name
-        self._attrs = dict[str, Any]()
+        self._attrs: Optional[dict[str, Any]] = None
+        self.symbol: Any = None
 
     @abstractmethod
     def __len__(self) -> int:
@@ -122,14 +136,29 @@ class Node(ABC):
         return False
 
     def setattr(self, name: str, value: Any):
-        """Set additional information on AST node."""
-        self._attrs[name] = value
+        """
+        Set additional information on AST node.
+        Kept for compatibility, prefer accessing `val` and `symbol` directly.
+        """
+        if name in _SLOT_ATTRS:
+            object.__setattr__(self, name, value)
+        else:
+            if self._attrs is None:
+                self._attrs = dict[str, Any]()
+            self._attrs[name] = value
 
     def getattr(self, name: str) -> Any:
         """
         Get additional information on AST node.
         Note that the default return value is `None` when the given name is not present.
         """
+        if name in _SLOT_ATTRS:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                return None
+        if self._attrs is None:
+            return None
         return self._attrs.get(name, None)
 
     def __iter__(self):
@@ -167,6 +196,8 @@ class NullType(Node):
     You can take `If` in `.tree` as an example.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("NULL")
 
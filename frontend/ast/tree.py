@@ -30,6 +30,8 @@ class ListNode(Node, Generic[_T]):
     E.g. `Block` (sequence of statements).
     """
 
+    __slots__ = ("children",)
+
     def __init__(self, name: str, children: list[_T]) -> None:
         super().__init__(name)
         self.children = children
@@ -50,6 +52,8 @@ class Program(ListNode["Function"]):
     AST root. It should have only one children before step9.
     """
 
+    __slots__ = ("globalScope",)
+
     def __init__(self, *children: Function) -> None:
         super().__init__("program", list(children))
 
@@ -71,6 +75,8 @@ class Function(Node):
     AST node that represents a function.
     """
 
+    __slots__ = ("ret_t", "ident", "body")
+
     def __init__(
         self,
         ret_t: TypeLiteral,
@@ -101,6 +107,8 @@ class Statement(Node):
     Abstract type that represents a statement.
     """
 
+    __slots__ = ()
+
     def is_block(self) -> bool:
         """
         Determine if this type of statement is `Block`.
@@ -113,6 +121,8 @@ class Return(Statement):
     AST node of return statement.
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expression) -> None:
         super().__init__("return")
         self.expr = expr
@@ -120,7 +130,7 @@ class Return(Statement):
     def __getitem__(self, key: Union[int, str]) -> Node:
         if isinstance(key, int):
             return (self.expr,)[key]
-        return self.__dict__[key]
+        return getattr(self, key)
 
     def __len__(self) -> int:
         return 1
@@ -134,6 +144,8 @@ class If(Statement):
     AST node of if statement.
     """
 
+    __slots__ = ("cond", "then", "otherwise")
+
     def __init__(
         self, cond: Expression, then: Statement, otherwise: Optional[Statement] = None
     ) -> None:
@@ -157,6 +169,8 @@ class While(Statement):
     AST node of while statement.
     """
 
+    __slots__ = ("cond", "body")
+
     def __init__(self, cond: Expression, body: Statement) -> None:
         super().__init__("while")
         self.cond = cond
@@ -177,6 +191,8 @@ class DoWhile(Statement):
     AST node of while statement.
     """
 
+    __slots__ = ("cond", "body")
+
     def __init__(self, cond: Expression, body: Statement) -> None:
         super().__init__("do_while")
         self.cond = cond
@@ -197,6 +213,8 @@ class For(Statement):
     AST node of while statement.
     """
 
+    __slots__ = ("init", "cond", "update", "body")
+
     def __init__(self, init: Union[Declaration, Expression], cond: Expression, update: Expression, body: Statement) -> None:
         super().__init__("for")
         self.init = init
@@ -219,6 +237,8 @@ class Break(Statement):
     AST node of break statement.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("break")
 
@@ -240,6 +260,8 @@ class Continue(Statement):
     AST node of break statement.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("continue")
 
@@ -261,6 +283,8 @@ class Block(Statement, ListNode[Union["Statement", "Declaration"]]):
     AST node of block "statement".
     """
 
+    __slots__ = ()
+
     def __init__(self, *children: Union[Statement, Declaration]) -> None:
         super().__init__("block", list(children))
 
@@ -276,6 +300,8 @@ class Declaration(Node):
     AST node of declaration.
     """
 
+    __slots__ = ("var_t", "ident", "init_expr")
+
     def __init__(
         self,
         var_t: TypeLiteral,
@@ -302,6 +328,8 @@ class Expression(Node):
     Abstract type that represents an evaluable expression.
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         self.type: Optional[DecafType] = None
@@ -313,6 +341,8 @@ class Unary(Expression):
     Note that the operation type (like negative) is not among its children.
     """
 
+    __slots__ = ("op", "operand")
+
     def __init__(self, op: UnaryOp, operand: Expression) -> None:
         super().__init__(f"unary({op.value})")
         self.op = op
@@ -340,6 +370,8 @@ class Binary(Expression):
     Note that the operation type (like plus or subtract) is not among its children.
     """
 
+    __slots__ = ("lhs", "op", "rhs")
+
     def __init__(self, op: BinaryOp, lhs: Expression, rhs: Expression) -> None:
         super().__init__(f"binary({op.value})")
         self.lhs = lhs
@@ -369,6 +401,8 @@ class Assignment(Binary):
     It's actually a kind of binary expression, but it'll make things easier if we use another accept method to handle it.
     """
 
+    __slots__ = ()
+
     def __init__(self, lhs: Identifier, rhs: Expression) -> None:
         super().__init__(BinaryOp.Assign, lhs, rhs)
 
@@ -381,6 +415,8 @@ class ConditionExpression(Expression):
     AST node of condition expression (`?:`).
     """
 
+    __slots__ = ("cond", "then", "otherwise")
+
     def __init__(
         self, cond: Expression, then: Expression, otherwise: Expression
     ) -> None:
@@ -392,7 +428,7 @@ class ConditionExpression(Expression):
     def __getitem__(self, key: Union[int, str]) -> Node:
         if isinstance(key, int):
             return (self.cond, self.then, self.otherwise)[key]
-        return self.__dict__[key]
+        return getattr(self, key)
 
     def __len__(self) -> int:
         return 3
@@ -413,10 +449,27 @@ class Identifier(Expression):
     AST node of identifier "expression".
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         super().__init__("identifier")
         self.value = value
 
+    @property
+    def val(self) -> Any:
+        """
+        The value of an identifier is always the temp variable of its symbol.
+        It is read-only: assign to `symbol.temp` instead.
+        """
+        return self.symbol.temp
+
+    def setattr(self, name: str, value: Any):
+        """
+        Same as `Node.setattr`, except that setting "val" is ignored since it is derived from `symbol`.
+        """
+        if name != "val":
+            super().setattr(name, value)
+
     def __getitem__(self, key: int) -> Node:
         raise _index_len_err(key, self)
 
@@ -438,6 +491,8 @@ class IntLiteral(Expression):
     AST node of int literal like `0`.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Union[int, str]) -> None:
         super().__init__("int_literal")
         self.value = int(value)
@@ -463,6 +518,8 @@ class TypeLiteral(Node):
     Abstract node type that represents a type literal like `int`.
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, name: str, _type: DecafType) -> None:
         super().__init__(name)
         self.type = _type
@@ -477,6 +534,8 @@ class TypeLiteral(Node):
 class TInt(TypeLiteral):
     "AST node of type `int`."
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("type_int", INT)
 
@@ -1,3 +1,5 @@
+from collections import deque
+
 import utils.riscv as riscv
 from frontend.ast import node
 from frontend.ast.tree import *
@@ -14,10 +16,77 @@ from utils.tac.temp import Temp
 The TAC generation phase: translate the abstract syntax tree into three-address code.
 """
 
+# Operators that translate to a single TAC operation.
+_UNARY_MAP = {
+    node.UnaryOp.Neg: tacop.UnaryOp.NEG,
+    node.UnaryOp.BitNot: tacop.UnaryOp.NOT,
+    node.UnaryOp.LogicNot: tacop.UnaryOp.SEQZ,
+}
+
+_BINARY_MAP = {
+    node.BinaryOp.Add: tacop.BinaryOp.ADD,
+    node.BinaryOp.Sub: tacop.BinaryOp.SUB,
+    node.BinaryOp.Mul: tacop.BinaryOp.MUL,
+    node.BinaryOp.Div: tacop.BinaryOp.DIV,
+    node.BinaryOp.Mod: tacop.BinaryOp.REM,
+    node.BinaryOp.LT: tacop.BinaryOp.SLT,
+    node.BinaryOp.GT: tacop.BinaryOp.SGT,
+    node.BinaryOp.LE: tacop.BinaryOp.LEQ,
+    node.BinaryOp.GE: tacop.BinaryOp.GEQ,
+    node.BinaryOp.EQ: tacop.BinaryOp.EQU,
+    node.BinaryOp.NE: tacop.BinaryOp.NEQ,
+}
+
+# Short-circuit operators, mapped to the branch that skips evaluating the right hand side.
+_SHORT_CIRCUIT = {
+    node.BinaryOp.LogicAnd: tacop.CondBranchOp.BEQ,
+    node.BinaryOp.LogicOr: tacop.CondBranchOp.BNE,
+}
+
+def _isEmpty(stmt: Node) -> bool:
+    """Whether the statement emits no code at all."""
+    return stmt is NULL or (type(stmt) is Block and len(stmt.children) == 0)
+
+
+def _endsWithJump(stmt: Node) -> bool:
+    """Whether control never falls through the end of the statement."""
+    while type(stmt) is Block and stmt.children:
+        stmt = stmt.children[-1]
+    return type(stmt) in (Return, Break, Continue)
+
 
 class TACGen(Visitor[FuncVisitor, None]):
     def __init__(self) -> None:
-        pass
+        # Map node types to their visit methods directly, skipping the `accept` trampoline.
+        self._dispatch = {
+            Block: self.visitBlock,
+            Return: self.visitReturn,
+            Break: self.visitBreak,
+            Continue: self.visitContinue,
+            Identifier: self.visitIdentifier,
+            Declaration: self.visitDeclaration,
+            Assignment: self.visitAssignment,
+            If: self.visitIf,
+            For: self.visitFor,
+            While: self.visitWhile,
+            DoWhile: self.visitDoWhile,
+            Unary: self.visitUnary,
+            Binary: self.visitBinary,
+            ConditionExpression: self.visitCondExpr,
+            IntLiteral: self.visitIntLiteral,
+            node.NullType: self.visitNULL,
+        }
+
+    def _visit(self, n: node.Node, mv: FuncVisitor) -> None:
+        self._dispatch[type(n)](n, mv)
+
+    def _visitExpr(self, expr: Expression, mv: FuncVisitor) -> None:
+        # Leaves are the most frequent expressions, so they are handled here without a dispatch.
+        t = type(expr)
+        if t is IntLiteral:
+            expr.val = mv.visitLoadConst(expr.value)
+        elif t is not Identifier:
+            self._dispatch[t](expr, mv)
 
     # Entry of this phase
     def transform(self, program: Program) -> TACProg:
@@ -26,7 +95,7 @@ class TACGen(Visitor[FuncVisitor, None]):
         # The function visitor of 'main' is special.
         mv = pw.visitMainFunc()
 
-        mainFunc.body.accept(self, mv)
+        self._visit(mainFunc.body, mv)
         # Remember to call mv.visitEnd after the translation a function.
         mv.visitEnd()
 
@@ -34,12 +103,30 @@ class TACGen(Visitor[FuncVisitor, None]):
         return pw.visitEnd()
 
     def visitBlock(self, block: Block, mv: FuncVisitor) -> None:
-        for child in block:
-            child.accept(self, mv)
+        # Nested blocks are flattened onto a worklist rather than visited recursively.
+        dispatch = self._dispatch
+        stack = deque([block])
+        while stack:
+            n = stack.pop()
+            if type(n) is Block:
+                stack.extend(reversed(n.children))
+            else:
+                dispatch[type(n)](n, mv)
+                # Whatever follows an unconditional jump is unreachable; emitting it would leave
+                # basic blocks without predecessors that the register allocator cannot handle.
+                if type(n) in (Return, Break, Continue):
+                    break
 
     def visitReturn(self, stmt: Return, mv: FuncVisitor) -> None:
-        stmt.expr.accept(self, mv)
-        mv.visitReturn(stmt.expr.getattr("val"))
+        expr = stmt.expr
+        self._visitExpr(expr, mv)
+        mv.visitReturn(expr.val)
+
+    def visitNULL(self, that: node.NullType, mv: FuncVisitor) -> None:
+        """
+        Empty statements and expressions (e.g. a missing 'for' init or update) emit nothing.
+        """
+        pass
 
     def visitBreak(self, stmt: Break, mv: FuncVisitor) -> None:
         mv.visitBranch(mv.getBreakLabel())
@@ -49,10 +136,9 @@ class TACGen(Visitor[FuncVisitor, None]):
 
     def visitIdentifier(self, ident: Identifier, mv: FuncVisitor) -> None:
         """
-        1. Set the 'val' attribute of ident as the temp variable of the 'symbol' attribute of ident.
+        Nothing to emit: the 'val' of an identifier is read from the temp variable of its 'symbol'.
         """
-        symbol = ident.getattr("symbol")
-        ident.setattr("val", symbol.temp)
+        pass
 
     def visitDeclaration(self, decl: Declaration, mv: FuncVisitor) -> None:
         """
@@ -60,11 +146,11 @@ class TACGen(Visitor[FuncVisitor, None]):
         2. Use mv.freshTemp to get a new temp variable for this symbol.
         3. If the declaration has an initial value, use mv.visitAssignment to set it.
         """
-        symbol = decl.getattr("symbol")
+        symbol = decl.symbol
         symbol.temp = mv.freshTemp()
-        if not isinstance(decl.init_expr, node.NullType):
-            decl.init_expr.accept(self, mv)
-            mv.visitAssignment(symbol.temp, decl.init_expr.getattr("val"))
+        if decl.init_expr is not NULL:
+            self._visit(decl.init_expr, mv)
+            mv.visitAssignment(symbol.temp, decl.init_expr.val)
 
     def visitAssignment(self, expr: Assignment, mv: FuncVisitor) -> None:
         """
@@ -72,53 +158,68 @@ class TACGen(Visitor[FuncVisitor, None]):
         2. Use mv.visitAssignment to emit an assignment instruction.
         3. Set the 'val' attribute of expr as the value of assignment instruction.
         """
-        expr.rhs.accept(self, mv)
-        symbol = expr.lhs.getattr("symbol")
-        expr.setattr("val", mv.visitAssignment(symbol.temp, expr.rhs.getattr("val")))
+        rhs = expr.rhs
+        self._visitExpr(rhs, mv)
+        symbol = expr.lhs.symbol
+        expr.val = mv.visitAssignment(symbol.temp, rhs.val)
 
     def visitIf(self, stmt: If, mv: FuncVisitor) -> None:
-        stmt.cond.accept(self, mv)
+        cond = stmt.cond
+        otherwise = stmt.otherwise
+        self._visit(cond, mv)
+        cv = cond.val
 
-        if stmt.otherwise is NULL:
-            skipLabel = mv.freshLabel()
-            mv.visitCondBranch(
-                tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), skipLabel
-            )
-            stmt.then.accept(self, mv)
-            mv.visitLabel(skipLabel)
-        else:
-            skipLabel = mv.freshLabel()
+        then = stmt.then
+
+        if _isEmpty(otherwise):
+            # Only the side effects of the condition matter if both branches are empty.
+            if not _isEmpty(then):
+                skipLabel = mv.freshLabel()
+                mv.visitCondBranch(tacop.CondBranchOp.BEQ, cv, skipLabel)
+                self._visit(then, mv)
+                mv.visitLabel(skipLabel)
+        elif _isEmpty(then):
             exitLabel = mv.freshLabel()
-            mv.visitCondBranch(
-                tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), skipLabel
-            )
-            stmt.then.accept(self, mv)
-            mv.visitBranch(exitLabel)
-            mv.visitLabel(skipLabel)
-            stmt.otherwise.accept(self, mv)
+            mv.visitCondBranch(tacop.CondBranchOp.BNE, cv, exitLabel)
+            self._visit(otherwise, mv)
             mv.visitLabel(exitLabel)
+        else:
+            skipLabel = mv.freshLabel()
+            mv.visitCondBranch(tacop.CondBranchOp.BEQ, cv, skipLabel)
+            self._visit(then, mv)
+            if _endsWithJump(then):
+                # No need to jump over the else branch if control never falls through.
+                mv.visitLabel(skipLabel)
+                self._visit(otherwise, mv)
+            else:
+                exitLabel = mv.freshLabel()
+                mv.visitBranch(exitLabel)
+                mv.visitLabel(skipLabel)
+                self._visit(otherwise, mv)
+                mv.visitLabel(exitLabel)
 
     def visitFor(self, stmt: For, mv: FuncVisitor) -> None:
         beginLabel = mv.freshLabel()
-        loopLabel = mv.freshLabel()
         breakLabel = mv.freshLabel()
-        stmt.init.accept(self, mv)
+        # Without an update, 'continue' can jump straight back to the condition.
+        hasUpdate = stmt.update is not NULL
+        loopLabel = mv.freshLabel() if hasUpdate else beginLabel
+        self._visit(stmt.init, mv)
 
         mv.openLoop(breakLabel, loopLabel)
         mv.visitLabel(beginLabel)
-        if not isinstance(stmt.cond, node.NullType):
-            stmt.cond.accept(self, mv)
-            mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), breakLabel)
-        stmt.body.accept(self, mv)
-        mv.visitLabel(loopLabel)
-        stmt.update.accept(self, mv)
+        if stmt.cond is not NULL:
+            self._visit(stmt.cond, mv)
+            mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.val, breakLabel)
+        self._visit(stmt.body, mv)
+        if hasUpdate:
+            mv.visitLabel(loopLabel)
+            self._visit(stmt.update, mv)
         mv.visitBranch(beginLabel)
         mv.visitLabel(breakLabel)
 
         mv.closeLoop()
 
-
-
     def visitWhile(self, stmt: While, mv: FuncVisitor) -> None:
         beginLabel = mv.freshLabel()
         loopLabel = mv.freshLabel()
@@ -126,10 +227,10 @@ class TACGen(Visitor[FuncVisitor, None]):
         mv.openLoop(breakLabel, loopLabel)
 
         mv.visitLabel(beginLabel)
-        stmt.cond.accept(self, mv)
-        mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.getattr("val"), breakLabel)
+        self._visit(stmt.cond, mv)
+        mv.visitCondBranch(tacop.CondBranchOp.BEQ, stmt.cond.val, breakLabel)
 
-        stmt.body.accept(self, mv)
+        self._visit(stmt.body, mv)
         mv.visitLabel(loopLabel)
         mv.visitBranch(beginLabel)
         mv.visitLabel(breakLabel)
@@ -141,81 +242,61 @@ class TACGen(Visitor[FuncVisitor, None]):
         mv.openLoop(breakLabel, loopLabel)
 
         mv.visitLabel(loopLabel)
-        stmt.body.accept(self, mv)
-        stmt.cond.accept(self, mv)
-        mv.visitCondBranch(tacop.CondBranchOp.BNE, stmt.cond.getattr("val"), loopLabel)
+        self._visit(stmt.body, mv)
+        self._visit(stmt.cond, mv)
+        mv.visitCondBranch(tacop.CondBranchOp.BNE, stmt.cond.val, loopLabel)
         mv.visitLabel(breakLabel)
         mv.closeLoop()
 
     def visitUnary(self, expr: Unary, mv: FuncVisitor) -> None:
-        expr.operand.accept(self, mv)
+        operand = expr.operand
+        self._visitExpr(operand, mv)
 
-        op = {
-            node.UnaryOp.Neg: tacop.UnaryOp.NEG,
-            node.UnaryOp.BitNot: tacop.UnaryOp.NOT,
-            node.UnaryOp.LogicNot: tacop.UnaryOp.SEQZ
-        }[expr.op]
-        expr.setattr("val", mv.visitUnary(op, expr.operand.getattr("val")))
+        op = _UNARY_MAP[expr.op]
+        expr.val = mv.visitUnary(op, operand.val)
 
     def visitBinary(self, expr: Binary, mv: FuncVisitor) -> None:
-        expr.lhs.accept(self, mv)
-        expr.rhs.accept(self, mv)
-
-        if expr.op == node.BinaryOp.LogicOr:
-            newReg = mv.visitBinary(tacop.BinaryOp.OR, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            mv.visitUnarySelf(tacop.UnaryOp.SNEZ, newReg)
-            expr.setattr("val", newReg)
-        elif expr.op == node.BinaryOp.LogicAnd:
-            newReg1 = mv.visitUnary(tacop.UnaryOp.SNEZ, expr.lhs.getattr("val"))
-            newReg2 = mv.visitUnary(tacop.UnaryOp.SNEZ, expr.rhs.getattr("val"))
-            mv.visitBinarySelf(tacop.BinaryOp.AND, newReg1, newReg2)
-            expr.setattr("val", newReg1)
-        elif expr.op == node.BinaryOp.LE:
-            newReg = mv.visitBinary(tacop.BinaryOp.SGT, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            mv.visitUnarySelf(tacop.UnaryOp.SEQZ, newReg)
-            expr.setattr("val", newReg)
-        elif expr.op == node.BinaryOp.GE:
-            newReg = mv.visitBinary(tacop.BinaryOp.SLT, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            mv.visitUnarySelf(tacop.UnaryOp.SEQZ, newReg)
-            expr.setattr("val", newReg)
-        elif expr.op == node.BinaryOp.EQ:
-            newReg = mv.visitBinary(tacop.BinaryOp.SUB, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            mv.visitUnarySelf(tacop.UnaryOp.SEQZ, newReg)
-            expr.setattr("val", newReg)
-        elif expr.op == node.BinaryOp.NE:
-            newReg = mv.visitBinary(tacop.BinaryOp.SUB, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            mv.visitUnarySelf(tacop.UnaryOp.SNEZ, newReg)
-            expr.setattr("val", newReg)
-        else:
-            op = {
-                node.BinaryOp.Add: tacop.BinaryOp.ADD,
-                node.BinaryOp.Sub: tacop.BinaryOp.SUB,
-                node.BinaryOp.Mul: tacop.BinaryOp.MUL,
-                node.BinaryOp.Div: tacop.BinaryOp.DIV,
-                node.BinaryOp.Mod: tacop.BinaryOp.REM,
-                node.BinaryOp.LT: tacop.BinaryOp.SLT,
-                node.BinaryOp.GT: tacop.BinaryOp.SGT
-            }[expr.op]
-            expr.setattr(
-                "val", mv.visitBinary(op, expr.lhs.getattr("val"), expr.rhs.getattr("val"))
-            )
+        lhs = expr.lhs
+        rhs = expr.rhs
+        self._visitExpr(lhs, mv)
+
+        # Most operators translate to a single TAC operation, so check for them first.
+        op = _BINARY_MAP.get(expr.op)
+        if op is not None:
+            self._visitExpr(rhs, mv)
+            expr.val = mv.visitBinary(op, lhs.val, rhs.val)
+            return
+
+        # The result already equals (lhs != 0) if the right hand side is skipped.
+        branchOp = _SHORT_CIRCUIT[expr.op]
+        endLabel = mv.freshLabel()
+        result = mv.visitUnary(tacop.UnaryOp.SNEZ, lhs.val)
+        mv.visitCondBranch(branchOp, result, endLabel)
+        self._visitExpr(rhs, mv)
+        mv.visitAssignment(result, mv.visitUnary(tacop.UnaryOp.SNEZ, rhs.val))
+        mv.visitLabel(endLabel)
+        expr.val = result
 
     def visitCondExpr(self, expr: ConditionExpression, mv: FuncVisitor) -> None:
         """
         1. Refer to the implementation of visitIf and visitBinary.
         """
-        expr.cond.accept(self, mv)
-        skipLabel = mv.freshLabel()
+        cond = expr.cond
+        then = expr.then
+        otherwise = expr.otherwise
+        self._visitExpr(cond, mv)
         returnValue = mv.freshTemp()
-        expr.otherwise.accept(self, mv)
-        mv.visitAssignment(returnValue,expr.otherwise.getattr("val"))
-        mv.visitCondBranch(
-            tacop.CondBranchOp.BEQ, expr.cond.getattr("val"), skipLabel
-        )
-        expr.then.accept(self, mv)
-        mv.visitAssignment(returnValue, expr.then.getattr("val"))
+        skipLabel = mv.freshLabel()
+        exitLabel = mv.freshLabel()
+        mv.visitCondBranch(tacop.CondBranchOp.BEQ, cond.val, skipLabel)
+        self._visitExpr(then, mv)
+        mv.visitAssignment(returnValue, then.val)
+        mv.visitBranch(exitLabel)
         mv.visitLabel(skipLabel)
-        expr.setattr("val", returnValue)
+        self._visitExpr(otherwise, mv)
+        mv.visitAssignment(returnValue, otherwise.val)
+        mv.visitLabel(exitLabel)
+        expr.val = returnValue
 
     def visitIntLiteral(self, expr: IntLiteral, mv: FuncVisitor) -> None:
-        expr.setattr("val", mv.visitLoad(expr.value))
+        expr.val = mv.visitLoadConst(expr.value)
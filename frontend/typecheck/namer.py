@@ -115,7 +115,7 @@ class Namer(Visitor[ScopeStack, None]):
         if not ctx.findConflict(decl.ident.value):
             symbol = VarSymbol(decl.ident.value, decl.var_t.type)
             ctx.declare(symbol)
-            decl.setattr("symbol", symbol)
+            decl.symbol = symbol
             if not isinstance(decl.init_expr, NullType):
                 decl.init_expr.accept(self, ctx)
         else:
@@ -128,7 +128,7 @@ class Namer(Visitor[ScopeStack, None]):
         if not isinstance(expr.lhs, Identifier) or not ctx.lookup(expr.lhs.value):
             raise DecafUndefinedVarError(expr.lhs.__str__())
         symbol = ctx.lookup(expr.lhs.value)
-        expr.lhs.setattr("symbol", symbol)
+        expr.lhs.symbol = symbol
         expr.rhs.accept(self, ctx)
 
     def visitUnary(self, expr: Unary, ctx: ScopeStack) -> None:
@@ -155,7 +155,7 @@ class Namer(Visitor[ScopeStack, None]):
         symbol = ctx.lookup(ident.value)
         if not symbol:
             raise DecafUndefinedVarError(ident.value)
-        ident.setattr("symbol", symbol)
+        ident.symbol = symbol
 
     def visitIntLiteral(self, expr: IntLiteral, ctx: ScopeStack) -> None:
         value = expr.value
@@ -0,0 +1,9 @@
+// Expected return value: 39
+// Only the taken arm of ?: is evaluated.
+int main() {
+    int a = 0;
+    int b = 0;
+    int c = 1 ? (a = 3) : (b = 4);
+    int d = 0 ? (a = 5) : 6;
+    return b * 100 + a * 10 + c + d;
+}
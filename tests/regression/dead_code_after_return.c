@@ -0,0 +1,8 @@
+// Expected return value: 1
+// Code after a return must not be emitted: the `bne` of `||` would split it into
+// basic blocks without predecessors, which the register allocator rejects.
+int main() {
+    int s = 0;
+    return 1;
+    return (1 || 2) + s;
+}
@@ -0,0 +1,11 @@
+// Expected return value: 3
+// An empty then-branch is compiled to a single `bne` over the else-branch.
+int main() {
+    int a = 1;
+    int x = 3;
+    if (a) {
+    } else {
+        x = 4;
+    }
+    return x;
+}
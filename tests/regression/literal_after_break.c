@@ -0,0 +1,10 @@
+// Expected return value: 1
+// The `1` in the loop condition must be loaded again instead of reusing the load before `break`.
+int main() {
+    int x = 0;
+    do {
+        x = x + 1;
+        break;
+    } while (x < 1);
+    return x;
+}
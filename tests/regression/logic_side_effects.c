@@ -0,0 +1,10 @@
+// Expected return value: 32
+// The right operand of && and || only runs when it can change the result.
+int main() {
+    int a = 0;
+    int b = 0;
+    int c = (a = 1) || (b = 5);
+    int d = (a = 0) && (b = 7);
+    int e = 1 && (a = 3);
+    return b * 100 + a * 10 + c + d + e;
+}
@@ -0,0 +1,9 @@
+// Expected return value: 6
+// `||` branches over its right hand side with `bne`, whose block must still get an edge to the branch target.
+int main() {
+    int a = 1;
+    int b = 0;
+    int c = a || b;
+    int d = 5;
+    return c + d;
+}
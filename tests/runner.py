@@ -0,0 +1,140 @@
+"""
+Regression runner: compiles every `tests/regression/*.c` to RISC-V and runs the
+assembly on a tiny simulator covering the instructions the backend emits.
+
+Each test program states its expected exit code on the first line, e.g.
+`// Expected return value: 6`. Run it from the repository root:
+
+    python3 tests/runner.py
+"""
+
+import glob
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import step_asm, step_tac  # noqa: E402  (main must be imported before the lexer)
+from frontend.lexer import lexer  # noqa: E402
+from frontend.parser import parser  # noqa: E402
+
+EXPECTED = re.compile(r"//\s*Expected return value:\s*(-?\d+)")
+MEM_OPERAND = re.compile(r"(-?\d+)\((\w+)\)")
+MAX_STEPS = 1000000
+
+
+def wrap(value: int) -> int:
+    value &= 0xFFFFFFFF
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def compile_to_asm(code: str) -> str:
+    parser.error_stack.clear()
+    program = parser.parse(code, lexer=lexer)
+    if parser.error_stack:
+        raise SyntaxError("\n".join(map(str, parser.error_stack)))
+    return str(step_asm(step_tac(program)))
+
+
+def simulate(asm: str) -> int:
+    labels = {}
+    instrs = []
+    for line in asm.splitlines():
+        line = line.split("#")[0].strip()
+        if not line or line.startswith("."):
+            continue
+        if line.endswith(":"):
+            labels[line[:-1]] = len(instrs)
+        else:
+            op, _, rest = line.partition(" ")
+            instrs.append((op, [arg.strip() for arg in rest.split(",")] if rest else []))
+
+    regs = {"x0": 0, "sp": 1 << 20}
+    mem = {}
+
+    def read(reg: str) -> int:
+        if reg not in regs:
+            raise RuntimeError("read of uninitialised register " + reg)
+        return regs[reg]
+
+    def address(operand: str) -> int:
+        offset, base = MEM_OPERAND.fullmatch(operand).groups()
+        return read(base) + int(offset)
+
+    pc = labels["main"]
+    for _ in range(MAX_STEPS):
+        op, args = instrs[pc]
+        pc += 1
+        if op == "ret":
+            return read("a0") & 0xFF
+        elif op == "li":
+            regs[args[0]] = wrap(int(args[1]))
+        elif op == "mv":
+            regs[args[0]] = read(args[1])
+        elif op == "addi":
+            regs[args[0]] = read(args[1]) + int(args[2])
+        elif op == "sw":
+            mem[address(args[1])] = read(args[0])
+        elif op == "lw":
+            addr = address(args[1])
+            if addr not in mem:
+                raise RuntimeError("load from uninitialised stack slot " + args[1])
+            regs[args[0]] = mem[addr]
+        elif op in ("seqz", "snez", "neg", "not"):
+            x = read(args[1])
+            regs[args[0]] = {
+                "seqz": int(x == 0),
+                "snez": int(x != 0),
+                "neg": wrap(-x),
+                "not": ~x,
+            }[op]
+        elif op in ("add", "sub", "mul", "div", "rem", "slt", "sgt"):
+            x, y = read(args[1]), read(args[2])
+            if op in ("div", "rem") and y == 0:
+                raise RuntimeError("division by zero")
+            regs[args[0]] = wrap({
+                "add": lambda: x + y,
+                "sub": lambda: x - y,
+                "mul": lambda: x * y,
+                "div": lambda: int(x / y),
+                "rem": lambda: x - int(x / y) * y,
+                "slt": lambda: int(x < y),
+                "sgt": lambda: int(x > y),
+            }[op]())
+        elif op in ("beq", "bne"):
+            if (read(args[1]) == 0) == (op == "beq"):
+                pc = labels[args[2]]
+        elif op == "j":
+            pc = labels[args[0]]
+        else:
+            raise RuntimeError("unsupported instruction " + op)
+    raise RuntimeError("step limit exceeded")
+
+
+def main() -> int:
+    failures = 0
+    cases = sorted(glob.glob(os.path.join(ROOT, "tests", "regression", "*.c")))
+    for path in cases:
+        name = os.path.relpath(path, ROOT)
+        with open(path, "r") as f:
+            code = f.read()
+        expected = int(EXPECTED.search(code).group(1))
+        try:
+            actual = simulate(compile_to_asm(code))
+        except Exception as e:
+            print("ERROR {}: {}: {}".format(name, type(e).__name__, e))
+            failures += 1
+            continue
+        if actual == expected:
+            print("OK    {}".format(name))
+        else:
+            print("FAIL  {}: expected {}, got {}".format(name, expected, actual))
+            failures += 1
+    print("{} passed, {} failed".format(len(cases) - failures, failures))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ from utils.label.label import Label, LabelKind
 
 
 class Context:
+    __slots__ = ("labels", "funcs", "nextTempLabelId")
+
     def __init__(self) -> None:
         self.labels = {}
         self.funcs = []
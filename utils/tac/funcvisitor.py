@@ -13,9 +13,21 @@ from .temp import Temp
 
 
 class FuncVisitor:
+    __slots__ = (
+        "ctx",
+        "func",
+        "constTemps",
+        "nextTempId",
+        "continueLabelStack",
+        "breakLabelStack",
+    )
+
     def __init__(self, entry: FuncLabel, numArgs: int, ctx: Context) -> None:
         self.ctx = ctx
         self.func = TACFunc(entry, numArgs)
+        # Temps already holding an integer constant, keyed by value.
+        # Cleared at every label and jump, so an entry never outlives the basic block that loaded it.
+        self.constTemps = {}
         self.visitLabel(entry)
         self.nextTempId = 0
 
@@ -49,6 +61,16 @@ class FuncVisitor:
             self.func.add(LoadStrConst(temp, value))
         return temp
 
+    # Same as 'visitLoad' for an int, but reuses the temp of an earlier load of the same value in the current basic block,
+    # i.e. since the last label, branch or return.
+    # The returned temp must not be written to.
+    def visitLoadConst(self, value: int) -> Temp:
+        temp = self.constTemps.get(value)
+        if temp is None:
+            temp = self.visitLoad(value)
+            self.constTemps[value] = temp
+        return temp
+
     def visitUnary(self, op: UnaryOp, operand: Temp) -> Temp:
         temp = self.freshTemp()
         self.func.add(Unary(op, temp, operand))
@@ -65,16 +87,21 @@ class FuncVisitor:
     def visitBinarySelf(self, op: BinaryOp, lhs: Temp, rhs: Temp) -> None:
         self.func.add(Binary(op, lhs, lhs, rhs))
 
+    # Jumps and labels end the current basic block, and code after them may be reached without running earlier loads.
     def visitBranch(self, target: Label) -> None:
+        self.constTemps.clear()
         self.func.add(Branch(target))
 
     def visitCondBranch(self, op: CondBranchOp, cond: Temp, target: Label) -> None:
+        self.constTemps.clear()
         self.func.add(CondBranch(op, cond, target))
 
     def visitReturn(self, value: Optional[Temp]) -> None:
+        self.constTemps.clear()
         self.func.add(Return(value))
 
     def visitLabel(self, label: Label) -> None:
+        self.constTemps.clear()
         self.func.add(Mark(label))
 
     def visitMemo(self, content: str) -> None:
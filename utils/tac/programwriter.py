@@ -11,6 +11,8 @@ from .tacprog import TACProg
 
 
 class ProgramWriter:
+    __slots__ = ("funcs", "ctx")
+
     def __init__(self, funcs: list[str]) -> None:
         self.funcs = []
         self.ctx = Context()
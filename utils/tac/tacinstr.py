@@ -10,7 +10,10 @@ from .tacvisitor import TACVisitor
 from .temp import Temp
 
 
+# Instructions are created once per emitted operation, so they declare `__slots__` to stay small.
 class TACInstr:
+    __slots__ = ("kind", "dsts", "srcs", "label")
+
     def __init__(
         self,
         kind: InstrKind,
@@ -19,8 +22,9 @@ class TACInstr:
         label: Optional[Label],
     ) -> None:
         self.kind = kind
-        self.dsts = dsts.copy()
-        self.srcs = srcs.copy()
+        # Callers always pass freshly built lists, so they are stored without copying.
+        self.dsts = dsts
+        self.srcs = srcs
         self.label = label
 
     def getRead(self) -> list[int]:
@@ -55,6 +59,8 @@ class TACInstr:
 
 # Assignment instruction.
 class Assign(TACInstr):
+    __slots__ = ("dst", "src")
+
     def __init__(self, dst: Temp, src: Temp) -> None:
         super().__init__(InstrKind.SEQ, [dst], [src], None)
         self.dst = dst
@@ -69,6 +75,8 @@ class Assign(TACInstr):
 
 # Loading an immediate 32-bit constant.
 class LoadImm4(TACInstr):
+    __slots__ = ("dst", "value")
+
     def __init__(self, dst: Temp, value: int) -> None:
         super().__init__(InstrKind.SEQ, [dst], [], None)
         self.dst = dst
@@ -83,6 +91,8 @@ class LoadImm4(TACInstr):
 
 # Unary operations.
 class Unary(TACInstr):
+    __slots__ = ("op", "dst", "operand")
+
     def __init__(self, op: UnaryOp, dst: Temp, operand: Temp) -> None:
         super().__init__(InstrKind.SEQ, [dst], [operand], None)
         self.op = op
@@ -102,6 +112,8 @@ class Unary(TACInstr):
 
 # Binary Operations.
 class Binary(TACInstr):
+    __slots__ = ("op", "dst", "lhs", "rhs")
+
     def __init__(self, op: BinaryOp, dst: Temp, lhs: Temp, rhs: Temp) -> None:
         super().__init__(InstrKind.SEQ, [dst], [lhs, rhs], None)
         self.op = op
@@ -133,6 +145,8 @@ class Binary(TACInstr):
 
 # Branching instruction.
 class Branch(TACInstr):
+    __slots__ = ("target",)
+
     def __init__(self, target: Label) -> None:
         super().__init__(InstrKind.JMP, [], [], target)
         self.target = target
@@ -146,6 +160,8 @@ class Branch(TACInstr):
 
 # Branching with conditions.
 class CondBranch(TACInstr):
+    __slots__ = ("op", "cond", "target")
+
     def __init__(self, op: CondBranchOp, cond: Temp, target: Label) -> None:
         super().__init__(InstrKind.BEQ, [], [cond], target)
         self.op = op
@@ -165,6 +181,8 @@ class CondBranch(TACInstr):
 
 # Return instruction.
 class Return(TACInstr):
+    __slots__ = ("value",)
+
     def __init__(self, value: Optional[Temp]) -> None:
         if value is None:
             super().__init__(InstrKind.RET, [], [], None)
@@ -181,6 +199,8 @@ class Return(TACInstr):
 
 # Annotation (used for debugging).
 class Memo(TACInstr):
+    __slots__ = ("msg",)
+
     def __init__(self, msg: str) -> None:
         super().__init__(InstrKind.SEQ, [], [], None)
         self.msg = msg
@@ -194,6 +214,8 @@ class Memo(TACInstr):
 
 # Label (function entry or branching target).
 class Mark(TACInstr):
+    __slots__ = ()
+
     def __init__(self, label: Label) -> None:
         super().__init__(InstrKind.LABEL, [], [], label)
 
@@ -17,9 +17,16 @@ class InstrKind(Enum):
     RET = auto()
 
 
+# Base class of operations.
+# Members are compared by identity, so hash them by identity as well.
+# This keeps dict lookups keyed by operations (here and in the AST) from calling `Enum.__hash__`, which is written in Python.
+class Operation(Enum):
+    __hash__ = object.__hash__
+
+
 # Kinds of unary operations.
 @unique
-class UnaryOp(Enum):
+class UnaryOp(Operation):
     NEG = auto()
     NOT = auto()
     SEQZ = auto()
@@ -28,7 +35,7 @@ class UnaryOp(Enum):
 
 # Kinds of binary operations.
 @unique
-class BinaryOp(Enum):
+class BinaryOp(Operation):
     ADD = auto()
     SUB = auto()
     MUL = auto()
@@ -46,6 +53,6 @@ class BinaryOp(Enum):
 
 # Kinds of branching with conditions.
 @unique
-class CondBranchOp(Enum):
+class CondBranchOp(Operation):
     BEQ = auto()
     BNE = auto()
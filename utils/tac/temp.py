@@ -1,5 +1,7 @@
 # Temporary variables.
 class Temp:
+    __slots__ = ("index",)
+
     def __init__(self, index: int) -> None:
         self.index = index
 